@@ -5,7 +5,14 @@ This module handles loading and parsing the tag configuration from a JSON file.
 """
 
 import json
-from typing import Dict, List
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Mapping, Tuple
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    # orjson parses faster; its errors subclass json.JSONDecodeError.
+    _loads = json.loads
 
 
 class ConfigurationLoader:
@@ -16,6 +23,8 @@ class ConfigurationLoader:
     and the value is an object with a 'keywords' array.
     """
     
+    __slots__ = ('config_path', 'tags_config', '_tags_config_view', '_available_tags')
+    
     def __init__(self, config_path: str = None):
         """
         Initialize the ConfigurationLoader.
@@ -31,31 +40,46 @@ class ConfigurationLoader:
             import os
             base_dir = os.path.dirname(__file__)
             self.config_path = os.path.join(base_dir, 'tag_config.json')
-        self.tags_config: Dict[str, List[str]] = {}
+        self.tags_config: Dict[str, Tuple[str, ...]] = {}
+        self._tags_config_view = MappingProxyType(self.tags_config)
+        self._available_tags: Tuple[str, ...] = ()
         
     def load_configuration(self) -> None:
         """
         Load and parse the configuration file.
         
+        The file is read as raw bytes and parsed with orjson when it is
+        installed, falling back to the standard json module. If loading
+        fails, the previously loaded configuration is left unchanged.
+        
         Raises:
             FileNotFoundError: If the configuration file doesn't exist
             json.JSONDecodeError: If the configuration file is not valid JSON
             KeyError: If the configuration structure is invalid
+            ValueError: If a tag has an empty 'keywords' array
         """
         try:
-            with open(self.config_path, 'r') as file:
-                config_data = json.load(file)
+            with self._open() as file:
+                config_data = _loads(file.read())
                 
             if 'tags' not in config_data:
                 raise KeyError("Configuration must contain a 'tags' object")
             
+            tags_config: Dict[str, Tuple[str, ...]] = {}
             for tag_name, tag_data in config_data['tags'].items():
                 if 'keywords' not in tag_data:
                     raise KeyError(f"Tag '{tag_name}' must contain a 'keywords' array")
                 
-                self.tags_config[tag_name] = [
-                    keyword.lower() for keyword in tag_data['keywords']
-                ]
+                if not tag_data['keywords']:
+                    raise ValueError(f"Tag '{tag_name}' must define at least one keyword")
+                
+                tags_config[tag_name] = tuple(map(str.lower, tag_data['keywords']))
+            
+            # Publish only a fully validated configuration. The dict is updated
+            # in place because the read-only view wraps it.
+            self.tags_config.clear()
+            self.tags_config.update(tags_config)
+            self._available_tags = tuple(tags_config)
                 
         except FileNotFoundError:
             raise FileNotFoundError(
@@ -68,20 +92,29 @@ class ConfigurationLoader:
                 e.pos
             )
     
-    def get_tags_config(self) -> Dict[str, List[str]]:
+    def _open(self) -> BinaryIO:
+        """
+        Open the configuration file for reading as bytes.
+        
+        Returns:
+            Binary file object for the configuration file
+        """
+        return open(self.config_path, 'rb')
+    
+    def get_tags_config(self) -> Mapping[str, Tuple[str, ...]]:
         """
         Get the loaded tags configuration.
         
         Returns:
-            Dictionary mapping tag names to their associated keywords
+            Read-only mapping of tag names to tuples of their keywords
         """
-        return self.tags_config
+        return self._tags_config_view
     
-    def get_available_tags(self) -> List[str]:
+    def get_available_tags(self) -> Tuple[str, ...]:
         """
-        Get a list of all available tag names.
+        Get all available tag names.
         
         Returns:
-            List of tag names
+            Tuple of tag names, in configuration order
         """
-        return list(self.tags_config.keys())
+        return self._available_tags
@@ -7,8 +7,6 @@ and receive tag suggestions.
 """
 
 import sys
-from config_loader import ConfigurationLoader
-from tagger_service import TaggerService
 
 
 class ApplicationRunner:
@@ -34,6 +32,10 @@ class ApplicationRunner:
         try:
             print("Initializing Intelligent Chat Message Tagger...")
             
+            # Imported here so that merely importing this module stays cheap.
+            from config_loader import ConfigurationLoader
+            from tagger_service import TaggerService
+            
             self.config_loader = ConfigurationLoader()
             self.config_loader.load_configuration()
             
@@ -58,20 +60,24 @@ class ApplicationRunner:
         Run the interactive command-line interface.
         
         Prompts the user to enter messages and displays tag suggestions.
+        The banner and each result block are written to stdout in a single
+        call, which keeps scripted (piped) sessions cheap.
         """
-        print("=" * 60)
-        print("WELCOME TO MY INTELLIGENT CHAT MESSAGE TAGGER")
-        print("=" * 60)
-        print()
-        print("Enter a customer message to analyze.")
-        print("HERE ARE SOME EXAMPLE MESSAGES YOU CAN TRY:")
-        print("*" * 60)
-        print("- I need help with my order.")
-        print("- Can you asssit me with a technical issue?")
-        print("- I'm looking for information on my account.")
-        print("*" * 60)
-        print("Type 'quit' or 'exit' to stop.")
-        print()
+        sys.stdout.write('\n'.join([
+            "=" * 60,
+            "WELCOME TO MY INTELLIGENT CHAT MESSAGE TAGGER",
+            "=" * 60,
+            "",
+            "Enter a customer message to analyze.",
+            "HERE ARE SOME EXAMPLE MESSAGES YOU CAN TRY:",
+            "*" * 60,
+            "- I need help with my order.",
+            "- Can you asssit me with a technical issue?",
+            "- I'm looking for information on my account.",
+            "*" * 60,
+            "Type 'quit' or 'exit' to stop.",
+            "",
+        ]) + '\n')
         
         while True:
             try:
@@ -91,12 +97,12 @@ class ApplicationRunner:
                 
                 primary_tag, secondary_tag = self.tagger_service.analyze_message(message)
                 
-                print()
-                print("-" * 60)
-                print(f"Primary Tag:   {primary_tag}")
-                print(f"Secondary Tag: {secondary_tag}")
-                print("-" * 60)
-                print()
+                sys.stdout.write(
+                    f"\n{'-' * 60}\n"
+                    f"Primary Tag:   {primary_tag}\n"
+                    f"Secondary Tag: {secondary_tag}\n"
+                    f"{'-' * 60}\n\n"
+                )
                 
             except KeyboardInterrupt:
                 print("\n\nInterrupted by user. Exiting...")
@@ -5,9 +5,64 @@ This module provides the core tagging logic for analyzing messages
 and assigning relevant tags based on keyword matching.
 """
 
+import heapq
 import re
-from typing import Dict, List, Tuple
 from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional accelerator; scoring falls back to token counting without it.
+    ahocorasick = None
+
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+
+def _count_keyword_hits(ids, offsets, owners, scores):
+    """
+    Count keyword hits per tag for a packed batch of messages.
+    
+    Compiled with Numba by _batch_kernel; kept at module level with no free
+    variables so the compiled code can be cached on disk.
+    
+    Args:
+        ids: Keyword ids of every matched token, message after message
+        offsets: Start of each message in ids, plus a final end offset
+        owners: (keywords x tags) matrix, 1 where a tag owns a keyword
+        scores: Zeroed (messages x tags) matrix, filled in place
+    """
+    n_tags = owners.shape[1]
+    for m in range(offsets.shape[0] - 1):
+        for i in range(offsets[m], offsets[m + 1]):
+            keyword_id = ids[i]
+            for t in range(n_tags):
+                scores[m, t] += owners[keyword_id, t]
+
+
+@lru_cache(maxsize=None)
+def _batch_kernel():
+    """
+    Import Numba and compile the batch scoring kernel on first use.
+    
+    NumPy and Numba take longer to import than the rest of the service, so
+    they are only loaded once score_batch is actually called. The compiled
+    kernel is cached on disk, so later processes skip the JIT compile.
+    
+    Returns:
+        Tuple of (numpy module, keyword hit counting kernel), or None if
+        Numba is not installed
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        # Optional accelerator; score_batch scores one message at a time without it.
+        return None
+    
+    return np, njit(cache=True)(_count_keyword_hits)
 
 
 class TaggerService:
@@ -18,14 +73,58 @@ class TaggerService:
     and returns the top 2 most relevant tags.
     """
     
+    __slots__ = (
+        'tags_config', '_default_tags', '_single', '_all_single_keywords',
+        '_multi', '_phrase_index', '_automaton',
+        '_keyword_ids', '_keyword_owners', '_analyze_cached'
+    )
+    
     def __init__(self, tags_config: Dict[str, List[str]]):
         """
         Initialize the TaggerService with tag configuration.
         
+        The configuration is copied into a read-only mapping so that cached
+        analysis results cannot go stale.
+        
         Args:
             tags_config: Dictionary mapping tag names to their associated keywords
         """
-        self.tags_config = tags_config
+        self.tags_config: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+            tag_name: tuple(keywords)
+            for tag_name, keywords in tags_config.items()
+        })
+        
+        tags = list(self.tags_config.keys())
+        if 'OTHER' in self.tags_config:
+            self._default_tags = ('OTHER', 'OTHER')
+        elif len(tags) >= 2:
+            self._default_tags = (tags[0], tags[1])
+        else:
+            self._default_tags = ('UNKNOWN', 'UNKNOWN')
+        
+        # Keywords go through the message tokenizer, so every scoring path
+        # sees "can't stop" as the same tokens as the message does.
+        tokenized = {
+            tag_name: [' '.join(self._tokenize(k)) for k in keywords]
+            for tag_name, keywords in self.tags_config.items()
+        }
+        self._single = {
+            tag_name: frozenset(k for k in keywords if k and ' ' not in k)
+            for tag_name, keywords in tokenized.items()
+        }
+        self._all_single_keywords = frozenset().union(*self._single.values())
+        self._multi = {
+            tag_name: tuple(dict.fromkeys(k for k in keywords if ' ' in k))
+            for tag_name, keywords in tokenized.items()
+        }
+        
+        self._phrase_index = self._build_phrase_index()
+        
+        self._automaton = self._build_automaton()
+        # Built by the first score_batch call that has Numba available.
+        self._keyword_ids: Optional[Dict[str, int]] = None
+        self._keyword_owners = None
+        self._analyze_cached = lru_cache(maxsize=4096)(self._analyze_impl)
         
     def analyze_message(self, message_text: str) -> Tuple[str, str]:
         """
@@ -33,29 +132,119 @@ class TaggerService:
         
         The algorithm:
         1. Normalizes the message to lowercase
-        2. Tokenizes the message into words
-        3. For each tag, counts how many of its keywords appear in the message
+        2. Tokenizes the message into words and counts them in a single pass
+        3. For each tag, sums the counts of its keywords, matching multi-word
+           keywords through an index of their first tokens
         4. Ranks tags by their score (keyword match count)
         5. Returns the top 2 tags
         
+        Results are memoized on the normalized message, so repeated messages
+        skip scoring entirely.
+        
         Args:
             message_text: The message to analyze
             
         Returns:
             Tuple of (primary_tag, secondary_tag)
         """
-        if not message_text or not message_text.strip():
+        if not message_text or message_text.isspace():
             return self._get_default_tags()
         
-        normalized_message = message_text.lower()
-        message_words = self._tokenize(normalized_message)
+        return self.analyze_normalized(message_text.lower())
+    
+    def analyze_normalized(self, lower_message: str) -> Tuple[str, str]:
+        """
+        Analyze an already lowercased message and return the top 2 tags.
+        
+        Fast path for callers that normalize messages upstream: the text is
+        used as-is, without another lowercase copy. The caller must pass
+        lowercase text; messages without any keyword, including empty ones,
+        resolve to the default tags.
         
-        tag_scores = self._calculate_tag_scores(message_words)
+        Args:
+            lower_message: The lowercase message to analyze
+            
+        Returns:
+            Tuple of (primary_tag, secondary_tag)
+        """
+        return self._analyze_cached(lower_message)
+    
+    def _analyze_impl(self, normalized_message: str) -> Tuple[str, str]:
+        """
+        Score, rank and select tags for an already normalized message.
+        
+        Messages without a single keyword match skip ranking and resolve
+        straight to the default tags.
+        
+        Args:
+            normalized_message: Lowercase, non-empty message text
+            
+        Returns:
+            Tuple of (primary_tag, secondary_tag)
+        """
+        tag_scores = self._calculate_tag_scores(normalized_message)
+        
+        if not any(tag_scores.values()):
+            return self._default_tags
         
         ranked_tags = self._rank_tags(tag_scores)
         
         return self._get_top_two_tags(ranked_tags)
     
+    def score_batch(self, messages: List[str]) -> List[Dict[str, int]]:
+        """
+        Score many messages at once.
+        
+        Without pyahocorasick but with Numba installed, single-word keyword
+        hits for the whole batch are packed into arrays and counted by one
+        JIT-compiled kernel. Otherwise each message is scored individually,
+        since the automaton scan already beats the kernel. The kernel and
+        the keyword index it reads are built on the first call that uses them.
+        
+        Args:
+            messages: Messages to score
+            
+        Returns:
+            List of dictionaries mapping tag names to scores, one per message
+        """
+        kernel = None if self._automaton is not None else _batch_kernel()
+        if kernel is None:
+            return [self._calculate_tag_scores(message.lower()) for message in messages]
+        
+        np, count_keyword_hits = kernel
+        if self._keyword_owners is None:
+            self._keyword_ids, self._keyword_owners = self._build_keyword_index(np)
+        
+        message_tokens = [self._tokenize(message.lower()) for message in messages]
+        get_id = self._keyword_ids.get
+        ids: List[int] = []
+        offsets = [0]
+        
+        for tokens in message_tokens:
+            for token in tokens:
+                keyword_id = get_id(token)
+                if keyword_id is not None:
+                    ids.append(keyword_id)
+            offsets.append(len(ids))
+        
+        hits = np.zeros((len(messages), len(self.tags_config)), dtype=np.int64)
+        count_keyword_hits(
+            np.array(ids, dtype=np.int32),
+            np.array(offsets, dtype=np.int64),
+            self._keyword_owners,
+            hits
+        )
+        
+        tag_names = tuple(self.tags_config)
+        batch_scores = []
+        
+        for tokens, row in zip(message_tokens, hits.tolist()):
+            tag_scores = dict(zip(tag_names, row))
+            self._add_phrase_scores(tokens, tag_scores)
+            batch_scores.append(tag_scores)
+        
+        return batch_scores
+    
     def _tokenize(self, text: str) -> List[str]:
         """
         Tokenize text into words, removing punctuation.
@@ -66,51 +255,184 @@ class TaggerService:
         Returns:
             List of words
         """
-        words = re.findall(r'\b\w+\b', text)
-        return words
+        return _TOKEN_RE.findall(text)
     
-    def _calculate_tag_scores(self, message_words: List[str]) -> Dict[str, int]:
+    def _build_phrase_index(self) -> Dict[str, Tuple[Tuple[List[str], Tuple[str, ...]], ...]]:
         """
-        Calculate scores for each tag based on keyword matches.
+        Index multi-word keywords by their first token.
+        
+        Returns:
+            Mapping of first token to (phrase tokens, owning tags) pairs
+        """
+        phrase_owners: Dict[str, List[str]] = {}
+        for tag_name, phrases in self._multi.items():
+            for phrase in phrases:
+                phrase_owners.setdefault(phrase, []).append(tag_name)
+        
+        index: Dict[str, List[Tuple[List[str], Tuple[str, ...]]]] = {}
+        for phrase, tag_names in phrase_owners.items():
+            words = phrase.split(' ')
+            index.setdefault(words[0], []).append((words, tuple(tag_names)))
+        
+        return {token: tuple(entries) for token, entries in index.items()}
+    
+    def _add_phrase_scores(self, tokens: List[str], tag_scores: Dict[str, int]) -> None:
+        """
+        Add multi-word keyword matches to the tag scores.
+        
+        Only positions whose token starts some phrase are checked, against
+        the phrases starting with that token, so the cost depends on the
+        message rather than on how many phrases are configured. Every phrase
+        is counted on its own, as with the automaton, so "credit card fee"
+        counts both "credit card" and "card fee".
+        
+        Args:
+            tokens: Lowercase message tokens
+            tag_scores: Dictionary of tag names to scores, updated in place
+        """
+        index = self._phrase_index
+        if not index:
+            return
+        
+        for position, token in enumerate(tokens):
+            candidates = index.get(token)
+            if candidates is None:
+                continue
+            for words, tag_names in candidates:
+                if tokens[position:position + len(words)] == words:
+                    for tag_name in tag_names:
+                        tag_scores[tag_name] += 1
+    
+    def _build_automaton(self):
+        """
+        Build an Aho-Corasick automaton over every keyword of every tag.
+        
+        Each keyword maps to its length and the tags that own it, so a single
+        scan of the message can score all tags at once.
+        
+        Returns:
+            The automaton, or None if pyahocorasick is not installed or no
+            keywords are configured
+        """
+        if ahocorasick is None:
+            return None
+        
+        owners: Dict[str, List[str]] = {}
+        for tag_name in self.tags_config:
+            for keyword in (*self._single[tag_name], *self._multi[tag_name]):
+                if keyword:
+                    owners.setdefault(keyword, []).append(tag_name)
+        
+        if not owners:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, tag_names in owners.items():
+            automaton.add_word(keyword, (len(keyword), tuple(tag_names)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_keyword_index(self, np):
+        """
+        Assign ids to single-word keywords for the batch scoring kernel.
+        
+        Args:
+            np: The numpy module loaded with the kernel
+            
+        Returns:
+            Tuple of (keyword-to-id mapping, keywords x tags ownership matrix)
+        """
+        keyword_ids: Dict[str, int] = {}
+        for words in self._single.values():
+            for word in words:
+                keyword_ids.setdefault(word, len(keyword_ids))
+        
+        owners = np.zeros((len(keyword_ids), len(self._single)), dtype=np.uint8)
+        for tag_index, words in enumerate(self._single.values()):
+            for word in words:
+                owners[keyword_ids[word], tag_index] = 1
+        
+        return keyword_ids, owners
+    
+    def _scan_automaton(self, normalized_message: str) -> Dict[str, int]:
+        """
+        Score all tags with a single Aho-Corasick pass over the message.
+        
+        The message is scanned as its tokens joined by single spaces, so a
+        hit only counts when it is bounded by spaces or the text edges.
         
         Args:
-            message_words: List of words from the message
+            normalized_message: Lowercase message text
             
         Returns:
             Dictionary mapping tag names to their scores
         """
-        tag_scores = {}
-        
-        for tag_name, keywords in self.tags_config.items():
-            score = 0
-            for keyword in keywords:
-                keyword_parts = keyword.split()
-                
-                if len(keyword_parts) == 1:
-                    score += message_words.count(keyword)
-                else:
-                    message_text = ' '.join(message_words)
-                    score += message_text.count(keyword)
+        text = ' '.join(self._tokenize(normalized_message))
+        last = len(text) - 1
+        tag_scores = dict.fromkeys(self.tags_config, 0)
+        
+        for end, (length, tag_names) in self._automaton.iter(text):
+            start = end - length + 1
+            if start > 0 and text[start - 1] != ' ':
+                continue
+            if end < last and text[end + 1] != ' ':
+                continue
+            for tag_name in tag_names:
+                tag_scores[tag_name] += 1
+        
+        return tag_scores
+    
+    def _calculate_tag_scores(self, normalized_message: str) -> Dict[str, int]:
+        """
+        Calculate scores for each tag based on keyword matches.
+        
+        Uses the Aho-Corasick automaton when available. Otherwise only tokens
+        that are single-word keywords of some tag are counted. Each tag sums
+        the counts of its keywords that occur, so the work follows the hits
+        rather than the tag's keyword count. Multi-word keywords are matched
+        through the first-token phrase index.
+        
+        Args:
+            normalized_message: Lowercase message text
             
-            tag_scores[tag_name] = score
+        Returns:
+            Dictionary mapping tag names to their scores
+        """
+        if self._automaton is not None:
+            return self._scan_automaton(normalized_message)
+        
+        tokens = _TOKEN_RE.findall(normalized_message)
+        word_counts = Counter(filter(self._all_single_keywords.__contains__, tokens))
+        if word_counts:
+            tag_scores = {
+                tag_name: sum(map(word_counts.__getitem__, words.intersection(word_counts)))
+                for tag_name, words in self._single.items()
+            }
+        else:
+            tag_scores = dict.fromkeys(self.tags_config, 0)
+        
+        self._add_phrase_scores(tokens, tag_scores)
         
         return tag_scores
     
     def _rank_tags(self, tag_scores: Dict[str, int]) -> List[Tuple[str, int]]:
         """
-        Rank tags by their scores in descending order.
+        Rank the top 2 tags by their scores in descending order.
+        
+        Only the two best tags are ever used, so a partial sort is enough.
+        Ties keep configuration order, as with a stable full sort.
         
         Args:
             tag_scores: Dictionary of tag names to scores
             
         Returns:
-            List of (tag_name, score) tuples sorted by score
+            Up to 2 (tag_name, score) tuples sorted by score
         """
-        return sorted(tag_scores.items(), key=lambda x: x[1], reverse=True)
+        return heapq.nlargest(2, tag_scores.items(), key=lambda x: x[1])
     
     def _get_top_two_tags(self, ranked_tags: List[Tuple[str, int]]) -> Tuple[str, str]:
         """
-        Get the top 2 tags from the ranked list.
+        Get the top 2 tags from the ranked top-2 list.
         
         If there are ties or insufficient tags, defaults to OTHER.
         
@@ -138,13 +460,10 @@ class TaggerService:
         """
         Get default tags when analysis fails or message is empty.
         
+        The defaults only depend on the configuration and are resolved once
+        at initialization.
+        
         Returns:
             Tuple of default tags
         """
-        tags = list(self.tags_config.keys())
-        if 'OTHER' in tags:
-            return 'OTHER', 'OTHER'
-        elif len(tags) >= 2:
-            return tags[0], tags[1]
-        else:
-            return 'UNKNOWN', 'UNKNOWN'
+        return self._default_tags
@@ -3,32 +3,130 @@ Unit tests for ApplicationRunner
 """
 
 import unittest
+import builtins
+import re
 import sys
+from collections import Counter
 from io import StringIO
-from unittest.mock import patch, MagicMock
-from main import ApplicationRunner
+from unittest.mock import patch
+
+
+def _swap(target, attr, new):
+    """Replace an attribute directly and return a callable that restores it"""
+    old = getattr(target, attr)
+    setattr(target, attr, new)
+    return lambda: setattr(target, attr, old)
+
+
+def _fake_input(responses):
+    """Return an input() replacement that returns or raises each response in order"""
+    answers = iter(responses)
+    
+    def fake_input(prompt=''):
+        answer = next(answers)
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+    
+    return fake_input
+
+
+_GOODBYE = "Thank you for using the Chat Message Tagger!"
+_INTERRUPTED = "Interrupted by user"
+_END_OF_INPUT = "End of input"
+_EMPTY_INPUT = "Please enter a valid message"
+
+_INTERACTIVE_CASES = [
+    (['quit'], [_GOODBYE]),
+    (['exit'], [_GOODBYE]),
+    ([KeyboardInterrupt()], [_INTERRUPTED]),
+    ([EOFError()], [_END_OF_INPUT]),
+    (['   ', 'quit'], [_EMPTY_INPUT, _GOODBYE]),
+]
+
+_EXPECTED_MESSAGES = (_GOODBYE, _INTERRUPTED, _END_OF_INPUT, _EMPTY_INPUT)
+_EXPECTED_RE = re.compile('|'.join(map(re.escape, _EXPECTED_MESSAGES)))
+
+
+class _Sniff:
+    """Stand-in for sys.stdout that counts expected messages as they are written"""
+    
+    # Enough trailing text to find a message split across two writes.
+    _window = max(map(len, _EXPECTED_MESSAGES)) - 1
+    
+    def __init__(self):
+        self.found = Counter()
+        self._tail = ''
+    
+    def write(self, text):
+        scanned = self._tail + text
+        # Matches ending inside the tail were counted by an earlier write.
+        for match in _EXPECTED_RE.finditer(scanned):
+            if match.end() > len(self._tail):
+                self.found[match.group()] += 1
+        self._tail = scanned[-self._window:]
+        return len(text)
+    
+    def flush(self):
+        pass
+
+
+class _FakeTagger:
+    """Tagger service stub that records messages and returns fixed tags"""
+    
+    def __init__(self, result=("TAG1", "TAG2")):
+        self.result = result
+        self.calls = []
+    
+    def analyze_message(self, message_text):
+        self.calls.append(message_text)
+        return self.result
 
 
 class TestApplicationRunner(unittest.TestCase):
     """Test cases for the ApplicationRunner class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the runner once for the whole class"""
+        # Imported here so test discovery does not load the application modules.
+        from main import ApplicationRunner
+        cls._app = ApplicationRunner()
+    
     def setUp(self):
         """Set up test fixtures before each test method"""
-        self.app = ApplicationRunner()
+        self._app.config_loader = None
+        self._app.tagger_service = None
+        self.app = self._app
+        
+        for target, attr in [
+            ('config_loader.ConfigurationLoader', 'mock_loader_cls'),
+            ('tagger_service.TaggerService', 'mock_tagger_cls'),
+        ]:
+            patcher = patch(target)
+            setattr(self, attr, patcher.start())
+            self.addCleanup(patcher.stop)
+    
+    def _stub_io(self, responses):
+        """Answer input() with responses and capture stdout until cleanup"""
+        stdout = StringIO()
+        self.addCleanup(_swap(sys, 'stdout', stdout))
+        self.addCleanup(_swap(builtins, 'input', _fake_input(responses)))
+        return stdout
     
     def test_initialization(self):
         """Test that ApplicationRunner initializes with None values"""
-        self.assertIsNone(self.app.config_loader)
-        self.assertIsNone(self.app.tagger_service)
+        from main import ApplicationRunner
+        app = ApplicationRunner()
+        
+        self.assertIsNone(app.config_loader)
+        self.assertIsNone(app.tagger_service)
     
-    @patch('main.ConfigurationLoader')
-    @patch('main.TaggerService')
-    def test_initialize_success(self, mock_tagger, mock_loader):
+    def test_initialize_success(self):
         """Test successful initialization"""
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = self.mock_loader_cls.return_value
         mock_loader_instance.get_tags_config.return_value = {"TEST": ["word"]}
         mock_loader_instance.get_available_tags.return_value = ["TEST"]
-        mock_loader.return_value = mock_loader_instance
         
         result = self.app.initialize()
         
@@ -37,102 +135,57 @@ class TestApplicationRunner(unittest.TestCase):
         self.assertIsNotNone(self.app.tagger_service)
         mock_loader_instance.load_configuration.assert_called_once()
     
-    @patch('main.ConfigurationLoader')
-    def test_initialize_file_not_found(self, mock_loader):
+    def test_initialize_file_not_found(self):
         """Test initialization failure when config file not found"""
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = self.mock_loader_cls.return_value
         mock_loader_instance.load_configuration.side_effect = FileNotFoundError("Config not found")
-        mock_loader.return_value = mock_loader_instance
         
         with patch('sys.stdout', new=StringIO()):
             result = self.app.initialize()
         
         self.assertFalse(result)
     
-    @patch('main.ConfigurationLoader')
-    def test_initialize_general_exception(self, mock_loader):
+    def test_initialize_general_exception(self):
         """Test initialization failure with general exception"""
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = self.mock_loader_cls.return_value
         mock_loader_instance.load_configuration.side_effect = Exception("General error")
-        mock_loader.return_value = mock_loader_instance
         
         with patch('sys.stdout', new=StringIO()):
             result = self.app.initialize()
         
         self.assertFalse(result)
     
-    @patch('builtins.input', side_effect=['quit'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_quit_command(self, mock_stdout, mock_input):
-        """Test that 'quit' command exits the interactive loop"""
-        self.app.tagger_service = MagicMock()
-        
-        self.app.run_interactive()
-        
-        output = mock_stdout.getvalue()
-        self.assertIn("Thank you for using the Chat Message Tagger!", output)
-    
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_exit_command(self, mock_stdout, mock_input):
-        """Test that 'exit' command exits the interactive loop"""
-        self.app.tagger_service = MagicMock()
-        
-        self.app.run_interactive()
-        
-        output = mock_stdout.getvalue()
-        self.assertIn("Thank you for using the Chat Message Tagger!", output)
+    def test_run_interactive_exits_and_prompts(self):
+        """Test exit commands, interrupts and empty input in interactive mode"""
+        for responses, expected in _INTERACTIVE_CASES:
+            with self.subTest(expected=expected, responses=responses):
+                sniff = _Sniff()
+                # Restored per case, so a failing case cannot leak into the next.
+                restore_stdout = _swap(sys, 'stdout', sniff)
+                restore_input = _swap(builtins, 'input', _fake_input(responses))
+                try:
+                    self.app.tagger_service = _FakeTagger()
+                    
+                    self.app.run_interactive()
+                finally:
+                    restore_input()
+                    restore_stdout()
+                
+                self.assertEqual(sniff.found, Counter(expected))
     
-    @patch('builtins.input', side_effect=['test message', 'quit'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_with_message(self, mock_stdout, mock_input):
+    def test_run_interactive_with_message(self):
         """Test processing a message in interactive mode"""
-        mock_tagger = MagicMock()
-        mock_tagger.analyze_message.return_value = ("TAG1", "TAG2")
-        self.app.tagger_service = mock_tagger
-        
-        self.app.run_interactive()
-        
-        output = mock_stdout.getvalue()
-        self.assertIn("TAG1", output)
-        self.assertIn("TAG2", output)
-        mock_tagger.analyze_message.assert_called_with('test message')
-    
-    @patch('builtins.input', side_effect=['   ', 'quit'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_empty_message(self, mock_stdout, mock_input):
-        """Test handling of empty message input"""
-        self.app.tagger_service = MagicMock()
-        
-        self.app.run_interactive()
-        
-        output = mock_stdout.getvalue()
-        self.assertIn("Please enter a valid message", output)
-    
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_keyboard_interrupt(self, mock_stdout, mock_input):
-        """Test handling of KeyboardInterrupt (Ctrl+C)"""
-        self.app.tagger_service = MagicMock()
-        
-        self.app.run_interactive()
-        
-        output = mock_stdout.getvalue()
-        self.assertIn("Interrupted by user", output)
-    
-    @patch('builtins.input', side_effect=EOFError())
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_eof_error(self, mock_stdout, mock_input):
-        """Test handling of EOFError"""
-        self.app.tagger_service = MagicMock()
+        stdout = self._stub_io(['test message', 'quit'])
+        fake_tagger = _FakeTagger(("TAG1", "TAG2"))
+        self.app.tagger_service = fake_tagger
         
         self.app.run_interactive()
         
-        output = mock_stdout.getvalue()
-        self.assertIn("End of input", output)
+        self.assertIn("Primary Tag:   TAG1\nSecondary Tag: TAG2\n", stdout.getvalue())
+        self.assertEqual(fake_tagger.calls, ['test message'])
     
-    @patch.object(ApplicationRunner, 'initialize', return_value=True)
-    @patch.object(ApplicationRunner, 'run_interactive')
+    @patch('main.ApplicationRunner.initialize', return_value=True)
+    @patch('main.ApplicationRunner.run_interactive')
     def test_run_success(self, mock_interactive, mock_init):
         """Test successful run returns 0"""
         exit_code = self.app.run()
@@ -141,7 +194,7 @@ class TestApplicationRunner(unittest.TestCase):
         mock_init.assert_called_once()
         mock_interactive.assert_called_once()
     
-    @patch.object(ApplicationRunner, 'initialize', return_value=False)
+    @patch('main.ApplicationRunner.initialize', return_value=False)
     def test_run_initialization_failure(self, mock_init):
         """Test run returns 1 when initialization fails"""
         exit_code = self.app.run()
@@ -149,15 +202,14 @@ class TestApplicationRunner(unittest.TestCase):
         self.assertEqual(exit_code, 1)
         mock_init.assert_called_once()
     
-    @patch('builtins.input', side_effect=['test', 'quit'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_run_interactive_none_tagger_service(self, mock_stdout, mock_input):
+    def test_run_interactive_none_tagger_service(self):
         """Test handling when tagger service is None"""
+        stdout = self._stub_io(['test', 'quit'])
         self.app.tagger_service = None
         
         self.app.run_interactive()
         
-        output = mock_stdout.getvalue()
+        output = stdout.getvalue()
         self.assertIn("Tagger service not initialized", output)
 
 
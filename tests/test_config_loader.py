@@ -3,49 +3,99 @@ Unit tests for ConfigurationLoader
 """
 
 import unittest
+import io
 import json
 import tempfile
 import os
+from unittest.mock import patch
 from config_loader import ConfigurationLoader
 
 
+_VALID_CFG = {
+    "tags": {
+        "TEST_TAG_1": {
+            "keywords": ["keyword1", "keyword2", "keyword3"]
+        },
+        "TEST_TAG_2": {
+            "keywords": ["keyword4", "keyword5"]
+        }
+    }
+}
+_VALID_CFG_JSON = json.dumps(_VALID_CFG)
+
+# (payload, error raised by load_configuration)
+_BAD_CONFIGS = [
+    ("{ invalid json content", json.JSONDecodeError),
+    (json.dumps({"not_tags": {}}), KeyError),
+    (json.dumps({"tags": {"BAD_TAG": {"not_keywords": ["word1"]}}}), KeyError),
+    (json.dumps({"tags": {"EMPTY_TAG": {"keywords": []}}}), ValueError),
+]
+
+
+def _in_memory(payload):
+    """Patch ConfigurationLoader to read the given JSON text instead of a file"""
+    return patch.object(
+        ConfigurationLoader, '_open', return_value=io.BytesIO(payload.encode())
+    )
+
+
 class TestConfigurationLoader(unittest.TestCase):
-    """Test cases for the ConfigurationLoader class"""
+    """Test cases for the ConfigurationLoader class that read from memory"""
+    
+    def test_load_invalid_configurations(self):
+        """Test the error raised for each kind of invalid configuration"""
+        for payload, expected_error in _BAD_CONFIGS:
+            with self.subTest(payload=payload):
+                with _in_memory(payload):
+                    loader = ConfigurationLoader("in_memory.json")
+                    
+                    with self.assertRaises(expected_error):
+                        loader.load_configuration()
     
-    def setUp(self):
-        """Set up test fixtures before each test method"""
-        self.valid_config = {
+    def test_keywords_converted_to_lowercase(self):
+        """Test that all keywords are converted to lowercase"""
+        config_with_uppercase = {
             "tags": {
-                "TEST_TAG_1": {
-                    "keywords": ["keyword1", "keyword2", "keyword3"]
-                },
-                "TEST_TAG_2": {
-                    "keywords": ["keyword4", "keyword5"]
+                "TEST": {
+                    "keywords": ["UPPER", "MiXeD", "lower"]
                 }
             }
         }
         
-    def tearDown(self):
-        """Clean up after each test method"""
-        pass
+        with _in_memory(json.dumps(config_with_uppercase)):
+            loader = ConfigurationLoader("in_memory.json")
+            loader.load_configuration()
+        
+        tags_config = loader.get_tags_config()
+        self.assertEqual(tags_config["TEST"], ("upper", "mixed", "lower"))
+
+
+class TestConfigurationLoaderFiles(unittest.TestCase):
+    """Test cases for the ConfigurationLoader class that touch the filesystem"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Write and load the valid configuration once for the read-only tests"""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.valid_path = os.path.join(cls._temp_dir.name, 'valid.json')
+        with open(cls.valid_path, 'w') as f:
+            f.write(_VALID_CFG_JSON)
+        
+        cls.valid_loader = ConfigurationLoader(cls.valid_path)
+        cls.valid_loader.load_configuration()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class's temporary directory"""
+        cls._temp_dir.cleanup()
     
     def test_load_valid_configuration(self):
         """Test loading a valid configuration file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.valid_config, f)
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            loader.load_configuration()
-            
-            tags_config = loader.get_tags_config()
-            self.assertIn("TEST_TAG_1", tags_config)
-            self.assertIn("TEST_TAG_2", tags_config)
-            self.assertEqual(tags_config["TEST_TAG_1"], ["keyword1", "keyword2", "keyword3"])
-            self.assertEqual(tags_config["TEST_TAG_2"], ["keyword4", "keyword5"])
-        finally:
-            os.unlink(temp_file)
+        tags_config = self.valid_loader.get_tags_config()
+        self.assertIn("TEST_TAG_1", tags_config)
+        self.assertIn("TEST_TAG_2", tags_config)
+        self.assertEqual(tags_config["TEST_TAG_1"], ("keyword1", "keyword2", "keyword3"))
+        self.assertEqual(tags_config["TEST_TAG_2"], ("keyword4", "keyword5"))
     
     def test_load_configuration_file_not_found(self):
         """Test that FileNotFoundError is raised when config file doesn't exist"""
@@ -54,121 +104,45 @@ class TestConfigurationLoader(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             loader.load_configuration()
     
-    def test_load_invalid_json(self):
-        """Test that JSONDecodeError is raised for invalid JSON"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("{ invalid json content")
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            
-            with self.assertRaises(json.JSONDecodeError):
-                loader.load_configuration()
-        finally:
-            os.unlink(temp_file)
-    
-    def test_load_configuration_missing_tags_key(self):
-        """Test that KeyError is raised when 'tags' key is missing"""
-        invalid_config = {"not_tags": {}}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            
-            with self.assertRaises(KeyError):
-                loader.load_configuration()
-        finally:
-            os.unlink(temp_file)
-    
-    def test_load_configuration_missing_keywords(self):
-        """Test that KeyError is raised when a tag is missing 'keywords'"""
-        invalid_config = {
-            "tags": {
-                "BAD_TAG": {
-                    "not_keywords": ["word1"]
-                }
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            
-            with self.assertRaises(KeyError):
-                loader.load_configuration()
-        finally:
-            os.unlink(temp_file)
-    
-    def test_keywords_converted_to_lowercase(self):
-        """Test that all keywords are converted to lowercase"""
-        config_with_uppercase = {
-            "tags": {
-                "TEST": {
-                    "keywords": ["UPPER", "MiXeD", "lower"]
-                }
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_with_uppercase, f)
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            loader.load_configuration()
-            
-            tags_config = loader.get_tags_config()
-            self.assertEqual(tags_config["TEST"], ["upper", "mixed", "lower"])
-        finally:
-            os.unlink(temp_file)
-    
     def test_get_available_tags(self):
         """Test getting list of available tags"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.valid_config, f)
-            temp_file = f.name
-        
-        try:
-            loader = ConfigurationLoader(temp_file)
-            loader.load_configuration()
-            
-            available_tags = loader.get_available_tags()
-            self.assertIsInstance(available_tags, list)
-            self.assertEqual(len(available_tags), 2)
-            self.assertIn("TEST_TAG_1", available_tags)
-            self.assertIn("TEST_TAG_2", available_tags)
-        finally:
-            os.unlink(temp_file)
+        available_tags = self.valid_loader.get_available_tags()
+        self.assertIsInstance(available_tags, tuple)
+        self.assertEqual(len(available_tags), 2)
+        self.assertIn("TEST_TAG_1", available_tags)
+        self.assertIn("TEST_TAG_2", available_tags)
+    
+    def test_tags_config_is_read_only(self):
+        """Test that the returned tags configuration cannot be mutated"""
+        tags_config = self.valid_loader.get_tags_config()
+        with self.assertRaises(TypeError):
+            tags_config["NEW_TAG"] = ["keyword"]
+        with self.assertRaises(AttributeError):
+            tags_config["TEST_TAG_1"].append("keyword")
     
-    def test_empty_keywords_list(self):
-        """Test handling of empty keywords list"""
-        config_empty_keywords = {
+    def test_failed_reload_keeps_previous_configuration(self):
+        """Test that a reload failing partway leaves the loaded tags intact"""
+        config_partly_invalid = {
             "tags": {
+                "NEW_TAG": {
+                    "keywords": ["new"]
+                },
                 "EMPTY_TAG": {
                     "keywords": []
                 }
             }
         }
+        loader = ConfigurationLoader(self.valid_path)
+        loader.load_configuration()
+        tags_config = loader.get_tags_config()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_empty_keywords, f)
-            temp_file = f.name
+        with _in_memory(json.dumps(config_partly_invalid)):
+            with self.assertRaises(ValueError):
+                loader.load_configuration()
         
-        try:
-            loader = ConfigurationLoader(temp_file)
-            loader.load_configuration()
-            
-            tags_config = loader.get_tags_config()
-            self.assertEqual(tags_config["EMPTY_TAG"], [])
-        finally:
-            os.unlink(temp_file)
+        self.assertEqual(loader.get_available_tags(), ("TEST_TAG_1", "TEST_TAG_2"))
+        self.assertEqual(list(tags_config), ["TEST_TAG_1", "TEST_TAG_2"])
+        self.assertIs(loader.get_tags_config(), tags_config)
 
 
 if __name__ == '__main__':
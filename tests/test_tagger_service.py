@@ -3,6 +3,7 @@ Unit tests for TaggerService
 """
 
 import unittest
+import tagger_service
 from tagger_service import TaggerService
 
 
@@ -91,6 +92,98 @@ class TestTaggerService(unittest.TestCase):
         
         self.assertEqual(primary, "TAG1")
     
+    def test_multi_word_keyword_across_punctuation(self):
+        """Test that multi-word keywords match when separated by punctuation"""
+        tags_config = {
+            "TAG1": ["not working"],
+            "TAG2": ["other"]
+        }
+        tagger = TaggerService(tags_config)
+        
+        scores = tagger._calculate_tag_scores("it's not, working at all")
+        
+        self.assertEqual(scores["TAG1"], 1)
+        self.assertEqual(scores["TAG2"], 0)
+    
+    def test_overlapping_keywords_counted_separately(self):
+        """Test that a word inside a matched phrase still counts on its own"""
+        tagger = TaggerService({"BILLING": ["credit card", "card"], "OTHER": []})
+        
+        scores = tagger._calculate_tag_scores("my credit card")
+        
+        self.assertEqual(scores["BILLING"], 2)
+    
+    def test_shared_phrase_scores_every_owning_tag(self):
+        """Test that a phrase configured for several tags scores each of them"""
+        tagger = TaggerService({
+            "TAG1": ["credit card", "not working"],
+            "TAG2": ["credit card"],
+            "TAG3": ["word"]
+        })
+        
+        scores = tagger._calculate_tag_scores("credit card not working, credit-card")
+        
+        self.assertEqual(scores, {"TAG1": 3, "TAG2": 2, "TAG3": 0})
+    
+    def test_overlapping_phrases_counted_separately(self):
+        """Test that phrases sharing words are each counted"""
+        tagger = TaggerService({"A": ["credit card", "card fee"], "B": ["card fee"]})
+        tagger._automaton = None
+        
+        scores = tagger._calculate_tag_scores("credit card fee")
+        
+        self.assertEqual(scores, {"A": 2, "B": 1})
+    
+    def test_many_phrases(self):
+        """Test scoring with thousands of multi-word keywords"""
+        tagger = TaggerService({
+            "A": [f"word{i} word{i + 1}" for i in range(5000)],
+            "B": ["word4998 word4999 word5000", "word7 word8"]
+        })
+        tagger._automaton = None
+        
+        scores = tagger._calculate_tag_scores("word7 word8 word9, word4998 word4999 word5000")
+        
+        self.assertEqual(scores, {"A": 4, "B": 2})
+    
+    def test_duplicate_keywords_counted_once(self):
+        """Test that a keyword listed twice for a tag is only scored once"""
+        tagger = TaggerService({"TAG1": ["buy", "buy", "credit card", "credit  card"]})
+        
+        scores = tagger._calculate_tag_scores("buy with my credit card")
+        
+        self.assertEqual(scores["TAG1"], 2)
+    
+    def test_keywords_and_tags_with_quotes(self):
+        """Test that keywords and tag names with quotes are scored"""
+        tagger = TaggerService({"it's": ["don't", "x'); import os; ('"], "TAG2": ["word"]})
+        tagger._automaton = None
+        
+        scores = tagger._calculate_tag_scores("don't word, x import os")
+        
+        self.assertEqual(scores, {"it's": 2, "TAG2": 1})
+    
+    def test_large_tags(self):
+        """Test that a tag with thousands of keywords can still be scored"""
+        tagger = TaggerService({
+            "BIG": [f"keyword{i}" for i in range(5000)],
+            "SMALL": ["keyword1", "other"]
+        })
+        tagger._automaton = None
+        
+        scores = tagger._calculate_tag_scores("keyword1 keyword4999 other nothing")
+        
+        self.assertEqual(scores, {"BIG": 2, "SMALL": 2})
+    
+    def test_tag_without_keywords(self):
+        """Test that a tag with no keywords always scores zero"""
+        tagger = TaggerService({"EMPTY": [], "TAG1": ["word"]})
+        
+        scores = tagger._calculate_tag_scores("word word")
+        
+        self.assertEqual(scores["EMPTY"], 0)
+        self.assertEqual(scores["TAG1"], 2)
+    
     def test_keyword_frequency_scoring(self):
         """Test that tags are scored by keyword frequency"""
         message = "buy buy buy help"
@@ -98,6 +191,29 @@ class TestTaggerService(unittest.TestCase):
         
         self.assertEqual(primary, "SALES")
     
+    def test_repeated_message_uses_cache(self):
+        """Test that repeated messages are served from the analysis cache"""
+        first = self.tagger.analyze_message("I need help with a bug")
+        second = self.tagger.analyze_message("I NEED HELP WITH A BUG")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.tagger._analyze_cached.cache_info().hits, 1)
+    
+    def test_config_is_read_only(self):
+        """Test that the tag configuration cannot be mutated after init"""
+        with self.assertRaises(TypeError):
+            self.tagger.tags_config["NEW_TAG"] = ("keyword",)
+    
+    def test_analyze_normalized(self):
+        """Test the fast path for already lowercased messages"""
+        message = "I have an issue and need help to fix this bug"
+        
+        self.assertEqual(
+            self.tagger.analyze_normalized(message.lower()),
+            self.tagger.analyze_message(message)
+        )
+        self.assertEqual(self.tagger.analyze_normalized(""), ("OTHER", "OTHER"))
+    
     def test_returns_tuple(self):
         """Test that analyze_message returns a tuple"""
         message = "test message"
@@ -106,6 +222,40 @@ class TestTaggerService(unittest.TestCase):
         self.assertIsInstance(result, tuple)
         self.assertEqual(len(result), 2)
     
+    def test_score_batch_matches_single_scoring(self):
+        """Test that batch scoring agrees with scoring messages one by one"""
+        messages = [
+            "I want to BUY and get a demo",
+            "",
+            "help! there is a bug, please fix it",
+            "zebra elephant giraffe",
+            "refund the invoice charge, then buy buy buy"
+        ]
+        
+        expected = [self.tagger._calculate_tag_scores(m.lower()) for m in messages]
+        
+        for use_automaton in (True, False):
+            with self.subTest(use_automaton=use_automaton):
+                tagger = TaggerService(self.tagger.tags_config)
+                if not use_automaton:
+                    tagger._automaton = None
+                
+                self.assertEqual(tagger.score_batch(messages), expected)
+    
+    def test_keyword_index_built_on_first_batch(self):
+        """Test that the batch keyword index is only built when first needed"""
+        tagger = TaggerService({"TAG1": ["buy"], "TAG2": ["help"]})
+        tagger._automaton = None
+        
+        self.assertIsNone(tagger._keyword_owners)
+        
+        tagger.score_batch(["buy"])
+        
+        if tagger_service._batch_kernel() is None:
+            self.assertIsNone(tagger._keyword_owners)
+        else:
+            self.assertEqual(set(tagger._keyword_ids), {"buy", "help"})
+    
     def test_tokenize_method(self):
         """Test the tokenization method"""
         text = "Hello, world! This is a test."
@@ -120,8 +270,7 @@ class TestTaggerService(unittest.TestCase):
     
     def test_calculate_tag_scores(self):
         """Test the tag scoring calculation"""
-        message_words = ["buy", "purchase", "help"]
-        scores = self.tagger._calculate_tag_scores(message_words)
+        scores = self.tagger._calculate_tag_scores("buy purchase help")
         
         self.assertIsInstance(scores, dict)
         self.assertGreater(scores["SALES"], 0)
@@ -129,16 +278,92 @@ class TestTaggerService(unittest.TestCase):
         self.assertEqual(scores["SALES"], 2)
         self.assertEqual(scores["SUPPORT"], 1)
     
+    @unittest.skipIf(tagger_service.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_scores_match_token_counting(self):
+        """Test that the Aho-Corasick scan agrees with the fallback scorer"""
+        cases = [
+            (
+                {
+                    "TAG1": ["credit card", "card", "multi word keyword"],
+                    "TAG2": ["card", "cards", "word"]
+                },
+                "credit, card! cards multi  word keyword credit-cardx word",
+                {"TAG1": 3, "TAG2": 4}
+            ),
+            (
+                {"A": ["credit card", "card fee"], "B": ["card fee"]},
+                "credit card fee",
+                {"A": 2, "B": 1}
+            ),
+            (
+                {"A": ["credit card", "credit card fee"], "B": ["card fee", "fee fee"]},
+                "credit card fee fee fee",
+                {"A": 2, "B": 3}
+            ),
+        ]
+        for config, message, expected in cases:
+            with self.subTest(message=message):
+                tagger = TaggerService(config)
+                
+                automaton_scores = tagger._calculate_tag_scores(message)
+                tagger._automaton = None
+                fallback_scores = tagger._calculate_tag_scores(message)
+                
+                self.assertEqual(automaton_scores, fallback_scores)
+                self.assertEqual(automaton_scores, expected)
+    
+    def test_keywords_with_punctuation(self):
+        """Test that keywords with punctuation match like the message tokens"""
+        tagger = TaggerService({"TAG1": ["can't stop", "e-mail"], "TAG2": ["stop"]})
+        
+        scores = tagger._calculate_tag_scores("i can't stop the e-mail")
+        
+        self.assertEqual(scores, {"TAG1": 2, "TAG2": 1})
+    
+    def test_phrases_respect_unicode_word_boundaries(self):
+        """Test that phrases do not match inside words with non-ASCII letters"""
+        tagger = TaggerService({"TAG1": ["not working"], "TAG2": ["café au lait"]})
+        tagger._automaton = None
+        
+        for message, expected in [
+            ("it is not working", {"TAG1": 1, "TAG2": 0}),
+            ("not é working", {"TAG1": 0, "TAG2": 0}),
+            ("ñnot working", {"TAG1": 0, "TAG2": 0}),
+            ("not workingé", {"TAG1": 0, "TAG2": 0}),
+            ("one café, au lait", {"TAG1": 0, "TAG2": 1}),
+        ]:
+            with self.subTest(message=message):
+                self.assertEqual(tagger._calculate_tag_scores(message), expected)
+    
+    @unittest.skipIf(tagger_service.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_keywords_with_punctuation(self):
+        """Test that both scoring paths agree on keywords with punctuation"""
+        tagger = TaggerService({"TAG1": ["can't stop", "e-mail"], "TAG2": ["stop"]})
+        message = "i can't stop the e-mail, can t stop"
+        
+        automaton_scores = tagger._calculate_tag_scores(message)
+        tagger._automaton = None
+        fallback_scores = tagger._calculate_tag_scores(message)
+        
+        self.assertEqual(automaton_scores, fallback_scores)
+    
     def test_rank_tags(self):
         """Test tag ranking by score"""
         scores = {"TAG1": 5, "TAG2": 10, "TAG3": 3}
         ranked = self.tagger._rank_tags(scores)
         
         self.assertIsInstance(ranked, list)
+        self.assertEqual(len(ranked), 2)
         self.assertEqual(ranked[0][0], "TAG2")
         self.assertEqual(ranked[0][1], 10)
         self.assertEqual(ranked[1][0], "TAG1")
-        self.assertEqual(ranked[2][0], "TAG3")
+    
+    def test_rank_tags_ties_keep_config_order(self):
+        """Test that tied scores keep the configured tag order"""
+        scores = {"TAG1": 1, "TAG2": 3, "TAG3": 3}
+        ranked = self.tagger._rank_tags(scores)
+        
+        self.assertEqual(ranked, [("TAG2", 3), ("TAG3", 3)])
     
     def test_punctuation_handling(self):
         """Test that punctuation is properly handled"""